@@ -6,7 +6,8 @@ Tests all scenarios from the task requirements without requiring external APIs.
 
 import asyncio
 import logging
-from typing import List, Union
+from collections.abc import AsyncIterator, Sequence
+from typing import Union
 
 from livekit import rtc
 from livekit.agents import stt
@@ -16,6 +17,18 @@ from livekit.plugins.filler_remover import FillerRemoverSTT
 # Type alias for AudioBuffer
 AudioBuffer = Union[list[rtc.AudioFrame], rtc.AudioFrame]
 
+# Default filler set shared by most scenarios
+FILLER_WORDS = ("uh", "umm", "hmm", "haan")
+
+# Silent frame passed to every recognize() call; MockSTT ignores the audio, so the
+# frame is shared and must be treated as read-only
+ZERO_FRAME = rtc.AudioFrame(
+    data=b"\x00" * 1000,
+    sample_rate=16000,
+    num_channels=1,
+    samples_per_channel=500,
+)
+
 
 # ANSI color codes for pretty output
 class Colors:
@@ -57,7 +70,7 @@ def print_result(actual: str, expected_behavior: str, passed: bool):
 class MockSTT(stt.STT):
     """Mock STT that returns predefined transcripts for testing"""
 
-    def __init__(self, transcripts: List[str]):
+    def __init__(self, transcripts: Sequence[str]):
         super().__init__(
             capabilities=stt.STTCapabilities(
                 streaming=True,
@@ -65,7 +78,13 @@ class MockSTT(stt.STT):
             )
         )
         self.transcripts = transcripts
-        self.current_index = 0
+        self._transcripts_it = iter(transcripts)
+        # Reused for every recognize() call, only the text changes. Callers must read
+        # the result before recognizing again
+        self._proto_event = stt.SpeechEvent(
+            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[stt.SpeechData(text="", language="en")],
+        )
 
     async def _recognize_impl(
         self,
@@ -75,51 +94,75 @@ class MockSTT(stt.STT):
         conn_options: APIConnectOptions,
     ) -> stt.SpeechEvent:
         """Return next transcript from the list"""
-        if self.current_index < len(self.transcripts):
-            text = self.transcripts[self.current_index]
-            self.current_index += 1
-        else:
-            text = "default response"
-
-        return stt.SpeechEvent(
-            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
-            alternatives=[stt.SpeechData(text=text, language="en")],
-        )
+        self._proto_event.alternatives[0].text = next(self._transcripts_it, "default response")
+        return self._proto_event
 
     def stream(
         self,
         *,
         language: NotGivenOr[str] = NOT_GIVEN,
         conn_options: APIConnectOptions,
-    ) -> "MockRecognizeStream":
+    ) -> AsyncIterator[stt.SpeechEvent]:
         """Return mock streaming interface"""
-        return MockRecognizeStream(self.transcripts)
+        return mock_recognize_stream(self.transcripts)
 
 
-class MockRecognizeStream:
+async def mock_recognize_stream(transcripts: Sequence[str]) -> AsyncIterator[stt.SpeechEvent]:
     """Mock streaming interface for testing"""
+    for text in transcripts:
+        yield stt.SpeechEvent(
+            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[stt.SpeechData(text=text, language="en")],
+        )
 
-    def __init__(self, transcripts: List[str]):
-        self.transcripts = transcripts
-        self.index = 0
 
-    def __aiter__(self):
-        return self
+class MockEventSTT(MockSTT):
+    """Mock STT whose stream yields typed events, each after an optional delay"""
+
+    def __init__(self, events: Sequence[tuple[stt.SpeechEventType, str]], delay: float = 0.0):
+        super().__init__(tuple(text for _, text in events))
+        self.events = events
+        self.delay = delay
 
-    async def __anext__(self) -> stt.SpeechEvent:
-        if self.index >= len(self.transcripts):
-            raise StopAsyncIteration
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions,
+    ) -> AsyncIterator[stt.SpeechEvent]:
+        """Return mock streaming interface"""
+        return mock_event_stream(self.events, self.delay)
 
-        text = self.transcripts[self.index]
-        self.index += 1
 
-        return stt.SpeechEvent(
-            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+async def mock_event_stream(
+    events: Sequence[tuple[stt.SpeechEventType, str]], delay: float
+) -> AsyncIterator[stt.SpeechEvent]:
+    """Mock streaming interface yielding typed events"""
+    for event_type, text in events:
+        await asyncio.sleep(delay)
+        yield stt.SpeechEvent(
+            type=event_type,
             alternatives=[stt.SpeechData(text=text, language="en")],
         )
 
-    async def aclose(self):
-        pass
+
+# One FillerRemoverSTT per distinct filler set, reused across scenarios
+_stt_wrappers: dict[tuple[str, ...], FillerRemoverSTT] = {}
+
+
+def get_stt_wrapper(
+    transcripts: Sequence[str], filler_words: Sequence[str] = FILLER_WORDS
+) -> FillerRemoverSTT:
+    """Return the cached wrapper for this filler set, pointed at a fresh MockSTT"""
+    mock_stt = MockSTT(transcripts)
+    key = tuple(sorted(filler_words))
+    stt_wrapper = _stt_wrappers.get(key)
+    if stt_wrapper is None:
+        stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=list(filler_words))
+        _stt_wrappers[key] = stt_wrapper
+    else:
+        stt_wrapper._underlying_stt = mock_stt
+    return stt_wrapper
 
 
 async def test_scenario_1():
@@ -132,22 +175,13 @@ async def test_scenario_1():
         ("umm", "Agent ignores and continues"),
     ]
 
-    filler_words = ["uh", "umm", "hmm", "haan"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases))
 
     results = []
     for input_text, expected_behavior in test_cases:
         print_test(input_text, True, expected_behavior)
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         # Filler-only input should result in empty string
@@ -169,22 +203,13 @@ async def test_scenario_2():
         ("hold on", "Agent stops immediately"),
     ]
 
-    filler_words = ["uh", "umm", "hmm", "haan"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases))
 
     results = []
     for input_text, expected_behavior in test_cases:
         print_test(input_text, True, expected_behavior)
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         # Real interruptions should pass through unchanged
@@ -222,22 +247,13 @@ async def test_scenario_4():
         ("hmm no thanks", "no thanks", "Agent stops (command detected)"),
     ]
 
-    filler_words = ["uh", "umm", "hmm", "haan"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases))
 
     results = []
     for input_text, expected_output, expected_behavior in test_cases:
         print_test(input_text, True, expected_behavior)
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         # Filler should be removed, command should remain
@@ -258,24 +274,16 @@ async def test_scenario_5():
     test_cases = [
         ("hmm yeah", "yeah", "Filler removed, weak affirmation remains"),
         ("uh huh", "huh", "Filler removed"),
+        ("uh-huh", "uh-huh", "Hyphenated word kept whole"),
     ]
 
-    filler_words = ["uh", "umm", "hmm", "haan"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases))
 
     results = []
     for input_text, expected_output, expected_behavior in test_cases:
         print_test(input_text, True, expected_behavior)
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         passed = actual == expected_output
@@ -289,23 +297,25 @@ async def test_streaming():
     """Test streaming mode with multiple events"""
     print_scenario(6, "Streaming Mode Test")
 
-    transcripts = [
+    transcripts = (
         "uh hello",  # Should become "hello"
         "uh hello world",  # Should become "hello world"
         "umm",  # Should be filtered completely
         "wait stop",  # Should pass through
-    ]
+        "uh-huh",  # Whole token, should pass through
+        "uh, hello",  # Filler and its comma removed
+    )
 
     expected_outputs = [
         "hello",
         "hello world",
         "",  # Empty, will be skipped
         "wait stop",
+        "uh-huh",
+        "hello",
     ]
 
-    filler_words = ["uh", "umm", "hmm"]
-    mock_stt = MockSTT(transcripts)
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(transcripts, ("uh", "umm", "hmm"))
 
     print("  Testing streaming transcript filtering...")
 
@@ -342,25 +352,22 @@ async def test_multi_language():
         ("haan okay", "okay", "Hindi filler removed"),
         ("uh this is good", "this is good", "English filler removed"),
         ("haan uh yes", "yes", "Multiple fillers removed"),
+        ("हा ठीक है", "ठीक है", "Devanagari filler removed"),
+        ("अं ठीक है", "अं ठीक है", "Word with a vowel sign kept whole"),
+        ("हाँ जी", "हाँ जी", "Word with a nasal sign kept whole"),
+        ("ठीक है हा।", "ठीक है।", "Filler before a danda removed"),
     ]
 
-    # Include Hindi filler words
-    filler_words = ["uh", "umm", "hmm", "haan", "accha"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    # Include Hindi filler words, romanized and in Devanagari
+    stt_wrapper = get_stt_wrapper(
+        tuple(tc[0] for tc in test_cases), FILLER_WORDS + ("accha", "अ", "हा")
+    )
 
     results = []
     for input_text, expected_output, expected_behavior in test_cases:
         print_test(input_text, True, expected_behavior)
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         passed = actual == expected_output
@@ -379,25 +386,28 @@ async def test_edge_cases():
         ("uh uh uh", "", "Multiple consecutive fillers"),
         ("hello", "hello", "No fillers present"),
         ("  uh  hello  ", "hello", "Extra whitespace"),
+        ("hmm's fine", "hmm's fine", "Contraction kept whole"),
+        ("a.uh.b", "a.uh.b", "Filler inside a dotted token kept"),
+        ("Uh, well", "well", "Pause comma removed with the filler"),
+        ("umm... so", "so", "Pause ellipsis removed with the filler"),
+        ("hello uh.", "hello.", "Sentence end kept without a gap"),
+        ("uh? what", "what", "Orphaned question mark dropped"),
+        ("hi. uh. there", "hi. there", "No doubled period"),
+        ("Okay. Um. So what", "Okay. So what", "No doubled period after capitalized filler"),
+        ("I see. Uh. Let me think.", "I see. Let me think.", "No doubled period mid-text"),
+        ("okay. uh! wait", "okay. wait", "No stray exclamation mark"),
+        ("hello! uh uh. bye", "hello! bye", "No stray period after a filler run"),
+        ("hello, uh.", "hello,", "No period stacked on a comma"),
     ]
 
-    filler_words = ["uh", "umm", "hmm"]
-    mock_stt = MockSTT([tc[0] for tc in test_cases])
-    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=filler_words)
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases), ("uh", "um", "umm", "hmm"))
 
     results = []
     for input_text, expected_output, description in test_cases:
         print(f"  Test: {description}")
         print(f"  Input: '{input_text}'")
 
-        buffer = rtc.AudioFrame(
-            data=b"\x00" * 1000,
-            sample_rate=16000,
-            num_channels=1,
-            samples_per_channel=500,
-        )
-
-        event = await stt_wrapper.recognize(buffer)
+        event = await stt_wrapper.recognize(ZERO_FRAME)
         actual = event.alternatives[0].text if event.alternatives else ""
 
         # Handle whitespace in comparison
@@ -411,6 +421,194 @@ async def test_edge_cases():
     return all(results)
 
 
+async def test_stem_fillers():
+    """Test fillers configured as stems with a trailing '*'"""
+    print_scenario(9, "Stem Fillers")
+
+    test_cases = [
+        ("ummmm ok", "ok", "Stretched filler removed"),
+        ("umm", "", "Bare stem removed"),
+        ("umbrella", "umbrella", "Word sharing a shorter prefix kept"),
+        ("ummhmm yes", "ummhmm yes", "Only the last letter of the stem repeats"),
+        ("errr fine", "fine", "Second stem removed"),
+        ("error found", "error found", "Real word starting with the stem kept"),
+        ("hello", "hello", "Bare '*' entry matches nothing"),
+    ]
+
+    # A lone "*" is an empty stem and must be ignored, not match every word
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases), ("umm*", "er*", "*"))
+
+    results = []
+    for input_text, expected_output, expected_behavior in test_cases:
+        print_test(input_text, True, expected_behavior)
+
+        event = await stt_wrapper.recognize(ZERO_FRAME)
+        actual = event.alternatives[0].text if event.alternatives else ""
+
+        passed = actual == expected_output
+        results.append(passed)
+        print_result(actual, expected_behavior, passed)
+
+    return all(results)
+
+
+async def test_multi_word_fillers():
+    """Test fillers made of several words"""
+    print_scenario(10, "Multi-Word Fillers")
+
+    test_cases = [
+        ("you know what", "what", "Phrase removed"),
+        ("you  know it works", "it works", "Phrase removed across extra whitespace"),
+        ("I MEAN yes", "yes", "Phrase matched regardless of case"),
+        ("youknow", "youknow", "Words run together kept"),
+        ("you said so", "you said so", "First word alone kept"),
+    ]
+
+    # Irregular spacing in the configuration is normalized too
+    stt_wrapper = get_stt_wrapper(tuple(tc[0] for tc in test_cases), ("you know", "  i   mean "))
+
+    results = []
+    for input_text, expected_output, expected_behavior in test_cases:
+        print_test(input_text, True, expected_behavior)
+
+        event = await stt_wrapper.recognize(ZERO_FRAME)
+        actual = event.alternatives[0].text if event.alternatives else ""
+
+        passed = actual == expected_output
+        results.append(passed)
+        print_result(actual, expected_behavior, passed)
+
+    return all(results)
+
+
+async def test_no_fillers_configured():
+    """Test that an empty filler list leaves every result untouched"""
+    print_scenario(11, "No Fillers Configured")
+
+    transcripts = ("uh hello", "umm", "wait stop")
+    mock_stt = MockSTT(transcripts)
+    stt_wrapper = FillerRemoverSTT(underlying_stt=mock_stt, filler_words=[])
+
+    results = []
+    for input_text in transcripts:
+        print_test(input_text, True, "Passed through unchanged")
+
+        event = await stt_wrapper.recognize(ZERO_FRAME)
+        actual = event.alternatives[0].text if event.alternatives else ""
+
+        # The underlying event itself is handed back, not a rewritten copy
+        passed = event is mock_stt._proto_event and actual == input_text
+        results.append(passed)
+        print_result(actual, "Passed through unchanged", passed)
+
+    print("  Testing streaming pass-through...")
+    actual_outputs = [event.alternatives[0].text async for event in stt_wrapper.stream()]
+    passed = actual_outputs == list(transcripts)
+    results.append(passed)
+    print(f"  Stream events: {actual_outputs}")
+    print(
+        f"  Status: {Colors.GREEN}✓ PASS{Colors.END}"
+        if passed
+        else f"  Status: {Colors.RED}✗ FAIL{Colors.END}"
+    )
+
+    return all(results)
+
+
+async def test_interim_coalescing():
+    """Test opt-in coalescing of superseded interim transcripts"""
+    print_scenario(12, "Interim Coalescing")
+
+    interim = stt.SpeechEventType.INTERIM_TRANSCRIPT
+    final = stt.SpeechEventType.FINAL_TRANSCRIPT
+
+    async def stream_texts(
+        events: Sequence[tuple[stt.SpeechEventType, str]],
+        delay: float = 0.0,
+        interim_debounce: float = 0.0,
+        cancel_first_after: float = 0.0,
+        close_after: float = 0.0,
+    ) -> list[str]:
+        stt_wrapper = FillerRemoverSTT(
+            underlying_stt=MockEventSTT(events, delay),
+            filler_words=["uh", "umm"],
+            interim_debounce=interim_debounce,
+        )
+        stream = stt_wrapper.stream()
+        if cancel_first_after:
+            # Give up on the first event early, as a caller using wait_for would
+            try:
+                await asyncio.wait_for(stream.__anext__(), cancel_first_after)
+            except asyncio.TimeoutError:
+                pass
+
+        async def collect() -> list[str]:
+            return [event.alternatives[0].text async for event in stream]
+
+        consumer = asyncio.ensure_future(collect())
+        if close_after:
+            # Close from another task while the consumer waits for the next event
+            await asyncio.sleep(close_after)
+        else:
+            await consumer
+        await stream.aclose()
+        return await consumer
+
+    refining = ((interim, "hello"), (interim, "uh hello there"), (final, "hello there"))
+    test_cases = [
+        (
+            "Every interim emitted by default",
+            await stream_texts(refining),
+            ["hello", "hello there", "hello there"],
+        ),
+        (
+            "Superseded interim dropped when enabled",
+            await stream_texts(refining, interim_debounce=0.05),
+            ["hello there", "hello there"],
+        ),
+        (
+            "Filler-only newer interim doesn't supersede",
+            await stream_texts(
+                ((interim, "hello world"), (interim, "uh"), (final, "uh")), interim_debounce=0.05
+            ),
+            ["hello world"],
+        ),
+        (
+            "Cancelled read loses no event",
+            await stream_texts(
+                ((interim, "first"), (interim, "second"), (final, "final")),
+                delay=0.1,
+                interim_debounce=0.05,
+                cancel_first_after=0.04,
+            ),
+            ["first", "second", "final"],
+        ),
+        (
+            "Closing mid-read ends the stream",
+            await stream_texts(
+                ((interim, "first"), (interim, "second"), (final, "final")),
+                delay=0.1,
+                close_after=0.15,
+            ),
+            ["first"],
+        ),
+    ]
+
+    results = []
+    for description, actual_outputs, expected_outputs in test_cases:
+        print(f"  Test: {description}")
+        passed = actual_outputs == expected_outputs
+        results.append(passed)
+        print(f"  Stream events: {actual_outputs}")
+        print(
+            f"  Status: {Colors.GREEN}✓ PASS{Colors.END}"
+            if passed
+            else f"  Status: {Colors.RED}✗ FAIL{Colors.END}"
+        )
+
+    return all(results)
+
+
 async def main():
     """Run all test scenarios"""
 
@@ -431,6 +629,10 @@ async def main():
         "Scenario 6: Streaming mode": await test_streaming(),
         "Scenario 7: Multi-language": await test_multi_language(),
         "Scenario 8: Edge cases": await test_edge_cases(),
+        "Scenario 9: Stem fillers": await test_stem_fillers(),
+        "Scenario 10: Multi-word fillers": await test_multi_word_fillers(),
+        "Scenario 11: No fillers configured": await test_no_fillers_configured(),
+        "Scenario 12: Interim coalescing": await test_interim_coalescing(),
     }
 
     # Print summary
@@ -464,7 +666,7 @@ async def main():
         "Robustness (20%)": results["Scenario 8: Edge cases"],
         "Real-time Performance (20%)": True,  # No lag in tests
         "Code Quality (15%)": True,  # Well-structured, documented
-        "Testing & Validation (15%)": total_count == 8,  # Comprehensive tests
+        "Testing & Validation (15%)": total_count >= 8,  # Comprehensive tests
     }
 
     for criterion, met in criteria.items():
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import AsyncIterator, Union
+from collections.abc import AsyncIterator
+from typing import Union
 
 from livekit import rtc
 from livekit.agents import stt
@@ -43,46 +44,32 @@ async def main():
             *,
             language: NotGivenOr[str] = NOT_GIVEN,
             conn_options: APIConnectOptions,
-        ) -> "MockRecognizeStream":
+        ) -> AsyncIterator[stt.SpeechEvent]:
             """Return mock streaming interface"""
-            return MockRecognizeStream()
+            return mock_recognize_stream()
 
-    class MockRecognizeStream:
+    async def mock_recognize_stream() -> AsyncIterator[stt.SpeechEvent]:
         """Mock streaming interface for testing"""
-
-        def __init__(self):
-            self._events = [
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
-                    alternatives=[stt.SpeechData(text="uh hello", language="en")],
-                ),
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.FINAL_TRANSCRIPT,
-                    alternatives=[stt.SpeechData(text="uh hello world", language="en")],
-                ),
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
-                    alternatives=[stt.SpeechData(text="umm", language="en")],
-                ),
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.FINAL_TRANSCRIPT,
-                    alternatives=[stt.SpeechData(text="umm", language="en")],
-                ),
-            ]
-            self._index = 0
-
-        def __aiter__(self):
-            return self
-
-        async def __anext__(self) -> stt.SpeechEvent:
-            if self._index >= len(self._events):
-                raise StopAsyncIteration
-            event = self._events[self._index]
-            self._index += 1
-            return event
-
-        async def aclose(self):
-            pass
+        events = [
+            stt.SpeechEvent(
+                type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
+                alternatives=[stt.SpeechData(text="uh hello", language="en")],
+            ),
+            stt.SpeechEvent(
+                type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+                alternatives=[stt.SpeechData(text="uh hello world", language="en")],
+            ),
+            stt.SpeechEvent(
+                type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
+                alternatives=[stt.SpeechData(text="umm", language="en")],
+            ),
+            stt.SpeechEvent(
+                type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+                alternatives=[stt.SpeechData(text="umm", language="en")],
+            ),
+        ]
+        for event in events:
+            yield event
 
     # Test configuration
     filler_words = ["uh", "umm"]
@@ -1,5 +1,10 @@
+import asyncio
+import dataclasses
+import functools
 import logging
-from typing import AsyncIterator, List
+import re
+from collections.abc import Callable, Iterable
+from typing import Any, Optional, Union
 
 from livekit.agents import stt
 from livekit.agents.types import (
@@ -10,6 +15,100 @@ from livekit.agents.types import (
 )
 from livekit.agents.utils import AudioBuffer
 
+# Trie markers, never a single character so they can't clash with filler letters
+_END = ""
+_STEM = "**"
+
+# A filler must be a whole token: it starts at whitespace or the start of the text, and
+# only punctuation may follow it before the next whitespace. Unlike \b this keeps "uh-huh",
+# "hmm's" and "a.uh.b" intact. The punctuation is listed explicitly, since "not \w" would
+# also take combining marks and cut "अ" out of "अं"
+_TOKEN_START = r"(?<!\S)"
+_TOKEN_END = r"(?=[.,;:!?\u2026\")\]}\u201d\u0964\u0965]*(?!\S))"
+
+# Punctuation an STT puts right after a filler to mark the pause, removed along with it
+_PAUSE_PUNCTUATION = r"(?:[,;:\u2026]|\.{2,})?"
+
+# Sentence-ending punctuation, kept after a filler unless nothing precedes it or the text
+# before the filler already ends in a pause or sentence mark
+_SENTENCE_END = ".?!\u0964"
+_PUNCTUATION_END = ".?!\u0964,;:\u2026"
+_LEADING_SENTENCE_END_RE = re.compile(r"[.?!\u0964]*\s*")
+
+# Upper bound on memoized transcripts; interim results repeat heavily
+_CACHE_SIZE = 256
+
+# Default seconds to wait for a newer interim transcript before emitting the current one,
+# coalescing is opt-in since interims drive interruption handling and shouldn't be delayed
+_INTERIM_DEBOUNCE = 0.0
+
+# Batch transcripts at least this long are cleaned in the default executor
+_OFFLOAD_MIN_CHARS = 4096
+
+
+def _first_chars(filler_words: frozenset[str]) -> frozenset[str]:
+    """First letter of every filler word, in both cases, for cheap fast-rejects."""
+    return frozenset(c for word in filler_words if word for c in (word[0], word[0].upper()))
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation of ``words`` with their common prefixes factored out.
+
+    ``re`` tries the branches of a flat alternation one after another at every position,
+    whereas the factored form walks a character trie, so each character is examined once
+    per level no matter how many filler words are configured. Optional suffixes are
+    greedy, which also makes the longest filler win (e.g. "uhh" over "uh").
+
+    A trailing ``*`` marks a stem: "umm*" matches "umm", "ummm", "ummmm", ... Only the last
+    letter repeats, so "er*" keeps "error" and "umm*" keeps "ummhmm".
+    A space in a multi-word filler matches any run of whitespace, so "you know" is found
+    in the same single pass even when the STT emits it as "you  know".
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        is_stem = word.endswith("*")
+        node = trie
+        for char in word[:-1].rstrip() if is_stem else word:
+            node = node.setdefault(char, {})
+        node[_STEM if is_stem else _END] = {}
+
+    def _node_pattern(node: dict[str, Any], last: str = "") -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + _node_pattern(child, char)
+            for char, child in sorted(node.items())
+            if char not in (_END, _STEM)
+        ]
+        if _STEM in node:
+            return "(?:" + "|".join(branches + [re.escape(last) + "*"]) + ")"
+        if not branches:
+            return ""
+        if _END in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return _node_pattern(trie)
+
+
+def _rewrite_event(event: stt.SpeechEvent, cleaned_text: str) -> stt.SpeechEvent:
+    """Return a copy of the event with its primary transcript replaced by the cleaned text."""
+    # replace() carries over every other field, including ones added upstream later
+    new_alternative = dataclasses.replace(event.alternatives[0], text=cleaned_text)
+    return dataclasses.replace(event, alternatives=[new_alternative, *event.alternatives[1:]])
+
+
+@dataclasses.dataclass(frozen=True)
+class _FilterContext:
+    """Filtering state built once per FillerRemoverSTT and shared by all of its streams."""
+
+    __slots__ = ("remove_fillers", "logger", "interim_debounce")
+
+    # FillerRemoverSTT._remove_fillers, so both paths share one compiled pattern and memo
+    remove_fillers: Callable[[str], str]
+    logger: logging.Logger
+    interim_debounce: float
+
 
 class FillerRemoverSTT(stt.STT):
     """STT wrapper that filters out filler words from transcripts in real-time.
@@ -18,20 +117,72 @@ class FillerRemoverSTT(stt.STT):
     (like "uh", "umm", "hmm") from the transcripts before returning them.
     """
 
-    def __init__(self, underlying_stt: stt.STT, filler_words: List[str]):
+    def __init__(
+        self,
+        underlying_stt: stt.STT,
+        filler_words: list[str],
+        *,
+        interim_debounce: float = _INTERIM_DEBOUNCE,
+    ):
         """Initialize the filler remover STT wrapper.
 
         Args:
             underlying_stt: The underlying STT engine to wrap
-            filler_words: List of filler words to remove from transcripts
+            filler_words: List of filler words to remove from transcripts, a trailing
+                ``*`` lets the last letter repeat (e.g. "umm*" for "ummm") and
+                multi-word phrases like "you know" are supported
+            interim_debounce: Seconds a streamed interim transcript waits for a newer one,
+                which replaces it, before being emitted. 0 (the default) disables coalescing
         """
         super().__init__(capabilities=underlying_stt.capabilities)
         self._underlying_stt = underlying_stt
-        self._filler_words = [word.lower() for word in filler_words]
+        # Multi-word fillers are normalized to single spaces, the pattern matches any gap
+        self._filler_words = frozenset(
+            " ".join(word.lower().split()) for word in filler_words if word.rstrip("*").strip()
+        )
+        # Nothing to remove with an empty list, both paths then hand results straight back
+        self._enabled = bool(self._filler_words)
+        self._filler_first_chars = _first_chars(self._filler_words)
+        filler_start = _TOKEN_START
+        if self._filler_first_chars:
+            # Only try the token-start lookbehind and the trie where a possible first letter
+            # follows, most positions in a transcript fail this single class test
+            first_chars_class = "".join(re.escape(c) for c in sorted(self._filler_first_chars))
+            filler_start = "(?=[" + first_chars_class + "])" + filler_start
+            if all(c.isalnum() or c == "_" for c in self._filler_first_chars):
+                # Word-character starts also sit on a \b, which re checks fastest of all
+                filler_start = r"\b" + filler_start
+        # Pause marks STTs attach to fillers ("Uh, well", "umm... so") go with them
+        filler = (
+            filler_start
+            + "(?:"
+            + _trie_pattern(self._filler_words)
+            + ")"
+            + _TOKEN_END
+            + _PAUSE_PUNCTUATION
+        )
+        # Consecutive fillers are matched as one run, so the whitespace handling around it
+        # sees the text that really follows. The run's trailing whitespace is matched too,
+        # so removing it leaves no gap and no whitespace-collapsing pass is needed
+        filler_pattern = filler + r"(?:\s+" + filler + r")*\s*"
+        self._filler_re = re.compile(filler_pattern, re.IGNORECASE)
+        # Same pattern with ASCII-only \b, \s and case folding, used for ASCII transcripts
+        # (the common case) where it matches identically but runs noticeably faster
+        self._filler_ascii_re = re.compile(filler_pattern, re.IGNORECASE | re.ASCII)
+        # The patterns never change after construction, so results can be memoized safely
+        self._strip_fillers_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(self._strip_fillers)
         self._logger = logging.getLogger(__name__)
+        self._context = _FilterContext(
+            remove_fillers=self._remove_fillers,
+            logger=self._logger,
+            interim_debounce=interim_debounce,
+        )
 
         # Log initialization with configured filler words
-        self._logger.warning(f"[FILLER-REMOVER] Initialized with filler words: {self._filler_words}")
+        self._logger.info(
+            "[FILLER-REMOVER] Initialized with %d filler words", len(self._filler_words)
+        )
+        self._logger.debug("[FILLER-REMOVER] Filler words: %s", self._filler_words)
 
     def _remove_fillers(self, text: str) -> str:
         """Remove filler words from the given text.
@@ -40,13 +191,56 @@ class FillerRemoverSTT(stt.STT):
             text: The text to filter
 
         Returns:
-            Filtered text with filler words removed
+            Filtered text with filler words removed, or ``text`` itself if nothing changed
         """
-        words = text.split()
-        # Naive implementation: remove filler words.
-        # A more robust implementation would handle punctuation and capitalization.
-        filtered_words = [word for word in words if word.lower() not in self._filler_words]
-        return " ".join(filtered_words)
+        # No filler can match unless the text contains one of their first letters
+        if self._filler_first_chars.isdisjoint(text):
+            return text
+
+        stripped_text = self._strip_fillers_cached(text)
+        return text if stripped_text is None else stripped_text
+
+    def _strip_fillers(self, text: str) -> Optional[str]:
+        """Uncached filler removal, returning None when nothing was removed.
+
+        None rather than ``text`` keeps cache hits from handing back an equal but different
+        string object, which would defeat the identity checks of the callers.
+        """
+        filler_re = self._filler_ascii_re if text.isascii() else self._filler_re
+        if "." not in text and "?" not in text and "!" not in text and "\u0964" not in text:
+            # Without sentence marks every run just goes with its trailing whitespace, so
+            # one substitution does it
+            stripped_text, num_removed = filler_re.subn("", text)
+            if not num_removed:
+                return None
+            return stripped_text.strip()
+
+        # Otherwise look at what surrounds each run (and its trailing whitespace)
+        pieces: list[str] = []
+        pos = 0
+        for match in filler_re.finditer(text):
+            start, end = match.span()
+            kept = text[pos:start]
+            if not pieces and not kept.strip():
+                # Nothing said before the run, so its "?" or "." would be left orphaned
+                end = _LEADING_SENTENCE_END_RE.match(text, end).end()
+            elif end == len(text) or text[end] in _SENTENCE_END:
+                before = (kept or pieces[-1]).rstrip()
+                if before and before[-1] in _PUNCTUATION_END:
+                    # "hi. uh. there" -> "hi. there", the run's own mark would double up
+                    end = _LEADING_SENTENCE_END_RE.match(text, end).end()
+                else:
+                    # "hello uh." -> "hello.", the gap before the filler goes instead
+                    kept = kept.rstrip()
+                    if not kept:
+                        pieces[-1] = pieces[-1].rstrip()
+            if kept:
+                pieces.append(kept)
+            pos = end
+        if not pos:
+            return None
+        pieces.append(text[pos:])
+        return "".join(pieces).strip()
 
     async def _recognize_impl(
         self,
@@ -69,29 +263,30 @@ class FillerRemoverSTT(stt.STT):
         event = await self._underlying_stt.recognize(
             buffer, language=language, conn_options=conn_options
         )
+        if not self._enabled:
+            return event
 
         if event.alternatives:
             original_text = event.alternatives[0].text
-            cleaned_text = self._remove_fillers(original_text)
+            if not original_text:
+                return event
 
-            if original_text != cleaned_text:
-                self._logger.warning(f"[BATCH] FILLER REMOVED: '{original_text}' -> '{cleaned_text}'")
+            if len(original_text) < _OFFLOAD_MIN_CHARS:
+                cleaned_text = self._remove_fillers(original_text)
             else:
-                self._logger.warning(f"[BATCH] NO FILLER: '{original_text}'")
+                # Long recognitions (e.g. whole files) shouldn't stall the event loop
+                loop = asyncio.get_running_loop()
+                cleaned_text = await loop.run_in_executor(None, self._remove_fillers, original_text)
+
+            # Nothing removed, hand back the underlying event untouched
+            if cleaned_text is original_text:
+                self._logger.debug("[BATCH] NO FILLER: '%s'", original_text)
+                return event
+
+            self._logger.debug("[BATCH] FILLER REMOVED: '%s' -> '%s'", original_text, cleaned_text)
 
             # If all words were fillers, return event with empty text
-            new_alternative = stt.SpeechData(
-                language=event.alternatives[0].language,
-                text=cleaned_text,
-                start_time=event.alternatives[0].start_time,
-                end_time=event.alternatives[0].end_time,
-                confidence=event.alternatives[0].confidence,
-            )
-            new_event = stt.SpeechEvent(
-                type=event.type,
-                alternatives=[new_alternative],
-            )
-            return new_event
+            return _rewrite_event(event, cleaned_text)
         return event
 
     def stream(
@@ -99,7 +294,7 @@ class FillerRemoverSTT(stt.STT):
         *,
         language: NotGivenOr[str] = NOT_GIVEN,
         conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
-    ) -> "FilteredRecognizeStream":
+    ) -> Union["FilteredRecognizeStream", stt.RecognizeStream]:
         """Stream transcription with filler words removed.
 
         Args:
@@ -107,100 +302,205 @@ class FillerRemoverSTT(stt.STT):
             conn_options: API connection options
 
         Returns:
-            Async iterator of SpeechEvent objects with filler words removed
+            Async iterator of SpeechEvent objects with filler words removed, the underlying
+            stream itself when no filler words are configured
         """
         underlying_stream = self._underlying_stt.stream(
             language=language, conn_options=conn_options
         )
-        return FilteredRecognizeStream(
-            underlying_stream=underlying_stream,
-            filler_words=self._filler_words,
-            logger=self._logger,
-        )
+        if not self._enabled:
+            return underlying_stream
+        return FilteredRecognizeStream(underlying_stream=underlying_stream, context=self._context)
 
 
 class FilteredRecognizeStream:
-    """Async iterator wrapper that filters filler words from streaming results."""
+    """Async iterator wrapper that filters filler words from streaming results.
 
-    def __init__(
-        self,
-        underlying_stream,
-        filler_words: List[str],
-        logger: logging.Logger,
-    ):
-        self._underlying_stream = underlying_stream
-        self._filler_words = filler_words
-        self._logger = logger
+    The next underlying event is always read ahead in its own task, one task per event, so
+    network wait overlaps with filtering and a cancelled ``__anext__`` loses nothing. That
+    read stays in flight until the stream is closed, so close it with ``aclose()`` (or use
+    ``async with``) even when breaking out of iteration early.
+    """
 
-    def _remove_fillers(self, text: str) -> str:
-        """Remove filler words from the given text."""
-        words = text.split()
-        filtered_words = [word for word in words if word.lower() not in self._filler_words]
-        return " ".join(filtered_words)
+    def __init__(self, underlying_stream, context: _FilterContext):
+        self._underlying_stream = underlying_stream
+        # Proxied methods resolved once, None when the underlying stream lacks them
+        self._push_frame = getattr(underlying_stream, "push_frame", None)
+        self._flush = getattr(underlying_stream, "flush", None)
+        self._aclose = getattr(underlying_stream, "aclose", None)
+        # Shared with the STT and its other streams, nothing is rebuilt per stream
+        self._context = context
+        # In-flight read of the next underlying event, started as soon as one is returned
+        self._prefetch: Optional[asyncio.Future[stt.SpeechEvent]] = None
+        # Filtered event not handed out yet, kept here rather than in a local so a cancelled
+        # __anext__ (e.g. under asyncio.wait_for) returns it on the next call
+        self._pending: Optional[stt.SpeechEvent] = None
+        self._closed = False
 
     def push_frame(self, frame):
         """Proxy push_frame to underlying stream."""
-        return self._underlying_stream.push_frame(frame)
+        if self._push_frame is None:
+            raise AttributeError(
+                f"{type(self._underlying_stream).__name__!r} stream has no push_frame"
+            )
+        return self._push_frame(frame)
 
     def flush(self):
         """Proxy flush to underlying stream."""
-        if hasattr(self._underlying_stream, "flush"):
-            return self._underlying_stream.flush()
+        if self._flush is not None:
+            return self._flush()
 
     def __aiter__(self):
         return self
 
     async def __anext__(self) -> stt.SpeechEvent:
-        event = await self._underlying_stream.__anext__()
+        context = self._context
+        while True:
+            if self._closed:
+                raise StopAsyncIteration
+            if self._pending is None:
+                self._pending = await self._read_filtered()
+            # A newer interim supersedes this one, the caller would overwrite it right away
+            if (
+                context.interim_debounce > 0
+                and self._pending.type == stt.SpeechEventType.INTERIM_TRANSCRIPT
+                and await self._replace_superseded_interim()
+            ):
+                continue
+            if self._closed:
+                # aclose() ran while we waited for a newer interim
+                raise StopAsyncIteration
+            event = self._pending
+            self._pending = None
+            return event
 
-        # Log all events for debugging
-        event_type = event.type if hasattr(event, 'type') else 'UNKNOWN'
+    def _take_prefetched(self, prefetch: asyncio.Future[stt.SpeechEvent]) -> stt.SpeechEvent:
+        """Consume a finished prefetch and start reading the event after it."""
+        if self._prefetch is prefetch:
+            self._prefetch = None
+        if self._closed or prefetch.cancelled():
+            # aclose() from another task stopped the read, end the way a closed livekit
+            # RecognizeStream does instead of leaking its CancelledError to the consumer
+            raise StopAsyncIteration
+        # StopAsyncIteration and errors propagate from here with no read left in flight
+        event = prefetch.result()
+        # Start reading the next event now so network wait overlaps with filtering
+        # this one and with whatever the caller does before asking again
+        self._prefetch = asyncio.ensure_future(self._underlying_stream.__anext__())
+        return event
 
+    async def _read_filtered(self) -> stt.SpeechEvent:
+        """Read underlying events until one survives filtering."""
+        # Loop rather than recurse when skipping events, a long run of filler-only
+        # transcripts must not grow the coroutine stack
+        while True:
+            prefetch = self._prefetch
+            if prefetch is None:
+                prefetch = self._prefetch = asyncio.ensure_future(
+                    self._underlying_stream.__anext__()
+                )
+            if not prefetch.done():
+                # Unlike awaiting the future directly, wait() leaves the read running when
+                # we are cancelled, the next call picks it up
+                await asyncio.wait((prefetch,))
+            event = self._filter(self._take_prefetched(prefetch))
+            if event is not None:
+                return event
+
+    async def _replace_superseded_interim(self) -> bool:
+        """Replace the pending interim with a newer one arriving within the debounce window.
+
+        The newer interim is filtered first, one that turns out filler-only doesn't count,
+        so the pending interim is only dropped for text the caller actually receives.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._context.interim_debounce
+        while True:
+            prefetch = self._prefetch
+            if prefetch is None:
+                return False
+            if not prefetch.done():
+                await asyncio.wait((prefetch,), timeout=max(deadline - loop.time(), 0))
+                if not prefetch.done():
+                    return False
+            # Errors and end of stream are left for the next read to raise
+            if (
+                self._closed
+                or prefetch.cancelled()
+                or prefetch.exception() is not None
+                or prefetch.result().type != stt.SpeechEventType.INTERIM_TRANSCRIPT
+            ):
+                return False
+            newer = self._filter(self._take_prefetched(prefetch))
+            if newer is not None:
+                self._context.logger.debug("[STREAM] Dropping interim superseded by a newer one")
+                self._pending = newer
+                return True
+
+    def _filter(self, event: stt.SpeechEvent) -> Optional[stt.SpeechEvent]:
+        """Remove fillers from a transcript event, None when nothing is left to emit."""
+        context = self._context
         if (
             event.type == stt.SpeechEventType.INTERIM_TRANSCRIPT
             or event.type == stt.SpeechEventType.FINAL_TRANSCRIPT
         ):
             if not event.alternatives:
-                self._logger.warning(f"[STREAM] Received {event_type} with no alternatives")
+                context.logger.debug("[STREAM] Received %s with no alternatives", event.type)
                 return event
 
-            original_text = event.alternatives[0].text
-            self._logger.warning(f"[STREAM] STT Event: {event_type} - Original: '{original_text}'")
+            alternative = event.alternatives[0]
+            original_text = alternative.text
+            # Empty transcripts come straight from the STT, nothing to filter
+            if not original_text:
+                return event
 
-            cleaned_text = self._remove_fillers(original_text)
+            cleaned_text = context.remove_fillers(original_text)
 
-            if original_text != cleaned_text:
-                self._logger.warning(f"[STREAM] FILLER REMOVED: '{original_text}' -> '{cleaned_text}'")
-            else:
-                self._logger.warning(f"[STREAM] NO FILLER: '{original_text}' (passed through)")
-
-            # If all words were fillers, skip this event and get next
-            if not cleaned_text.strip():
-                self._logger.warning(f"[STREAM] All fillers removed, skipping empty event")
-                return await self.__anext__()
-
-            # Create a new event with the cleaned text
-            new_alternative = stt.SpeechData(
-                language=event.alternatives[0].language,
-                text=cleaned_text,
-                start_time=event.alternatives[0].start_time,
-                end_time=event.alternatives[0].end_time,
-                confidence=event.alternatives[0].confidence,
-            )
-            new_event = stt.SpeechEvent(
-                type=event.type,
-                alternatives=[new_alternative],
+            # Nothing removed, hand back the underlying event untouched
+            if cleaned_text is original_text:
+                context.logger.debug(
+                    "[STREAM] %s: NO FILLER: '%s' (passed through)", event.type, original_text
+                )
+                return event
+
+            # If all words were fillers, skip this event. Cleaned text is already stripped,
+            # so an empty string is the only all-filler result
+            if not cleaned_text:
+                context.logger.debug(
+                    "[STREAM] %s: all fillers removed, skipping empty event: '%s'",
+                    event.type,
+                    original_text,
+                )
+                return None
+
+            context.logger.debug(
+                "[STREAM] %s: FILLER REMOVED: '%s' -> '%s'",
+                event.type,
+                original_text,
+                cleaned_text,
             )
-            return new_event
+            # Stream events are only handed to us, so SpeechData (a plain dataclass)
+            # can be updated in place instead of rebuilding the event
+            alternative.text = cleaned_text
+            return event
         else:
             # Log non-transcript events too
-            self._logger.debug(f"[STREAM] Non-transcript event: {event_type}")
+            context.logger.debug("[STREAM] Non-transcript event: %s", event.type)
             return event
 
     async def aclose(self):
         """Close the underlying stream."""
-        if hasattr(self._underlying_stream, "aclose"):
-            await self._underlying_stream.aclose()
+        # Set first, a consumer waiting in __anext__ wakes up to a cancelled read
+        self._closed = True
+        if self._prefetch is not None:
+            # Stop the pending read before closing the stream it is reading from, gather()
+            # also retrieves its result so no "exception was never retrieved" is logged
+            self._prefetch.cancel()
+            await asyncio.gather(self._prefetch, return_exceptions=True)
+            self._prefetch = None
+        self._pending = None
+        if self._aclose is not None:
+            await self._aclose()
 
     async def __aenter__(self):
         """Enter async context manager."""